@@ -1,7 +1,9 @@
 """Context Agent for user personalization and session management. This is a server-side A2A agent following ADK standards."""
 
+import itertools
 import os
 import sys
+import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -16,6 +18,10 @@ from .profile_manager import (
     update_user_profile,
 )
 
+# Per-process sequence that keeps session ids unique within a single clock tick; the timestamp
+# keeps them unique across restarts and instances
+_session_counter = itertools.count()
+
 
 def manage_session(
     user_id: str, action: Optional[str] = None, session_data: Optional[Dict[str, Any]] = None
@@ -31,7 +37,8 @@ def manage_session(
     Returns:
         Session management result
     """
-    session_id = f"session_{user_id}_{datetime.now().timestamp()}"
+    session_id = f"session_{user_id}_{time.time_ns()}_{next(_session_counter)}"
+    timestamp = datetime.now().isoformat()
 
     # Default action to "start" if None
     if action is None:
@@ -42,7 +49,7 @@ def manage_session(
             "session_id": session_id,
             "user_id": user_id,
             "status": "started",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "message": f"Session started for user {user_id}",
         }
     elif action == "update":
@@ -51,7 +58,7 @@ def manage_session(
             "user_id": user_id,
             "status": "updated",
             "data": session_data or {},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "message": f"Session updated for user {user_id}",
         }
     elif action == "end":
@@ -59,7 +66,7 @@ def manage_session(
             "session_id": session_id,
             "user_id": user_id,
             "status": "ended",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "message": f"Session ended for user {user_id}",
         }
 
@@ -95,19 +102,25 @@ def personalize_response(user_id: str, base_response: str) -> Dict[str, Any]:
     }
 
 
+# Wrap the tools once per process; FunctionTool introspects each signature on construction
+_TOOLS = tuple(
+    FunctionTool(tool)
+    for tool in (
+        fetch_user_profile,
+        update_user_profile,
+        get_user_preferences,
+        update_user_context,
+        get_personalization_data,
+        manage_session,
+        personalize_response,
+    )
+)
+
 # Create the context agent
 root_agent = Agent(
     name="context_agent",
     model="gemini-1.5-flash",
-    tools=[
-        FunctionTool(fetch_user_profile),
-        FunctionTool(update_user_profile),
-        FunctionTool(get_user_preferences),
-        FunctionTool(update_user_context),
-        FunctionTool(get_personalization_data),
-        FunctionTool(manage_session),
-        FunctionTool(personalize_response),
-    ],
+    tools=list(_TOOLS),
     instruction="""You are the Context Agent responsible for user personalization and preferences.
     
     **Your primary functions:**
@@ -24,4 +24,12 @@ if __name__ == "__main__":
 
     print("👤 Starting Context Agent A2A Server on port 8002...")
     print("📋 Agent Card URL: http://localhost:8002/.well-known/agent.json")
-    uvicorn.run("agents.context_agent.expose_a2a:a2a_app", host="localhost", port=8002, reload=False)
+    uvicorn.run(
+        "agents.context_agent.expose_a2a:a2a_app",
+        host="localhost",
+        port=8002,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
@@ -16,6 +17,7 @@ def fetch_user_profile(user_id: str) -> Dict[str, Any]:
         User profile data
     """
     # In production, this would query a real database
+    now = datetime.now().isoformat()
     default_profile = {
         "user_id": user_id,
         "name": "Unknown User",
@@ -27,13 +29,17 @@ def fetch_user_profile(user_id: str) -> Dict[str, Any]:
         },
         "context": {"industry": "general", "role": "user", "company": "", "interests": []},
         "session_history": [],
-        "created_at": datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat(),
+        "created_at": now,
+        "last_updated": now,
     }
 
     return {"status": "success", "profile": default_profile, "message": f"Profile retrieved for user {user_id}"}
 
 
+# Keywords that mark a profile update as a real estate preference
+_REAL_ESTATE_KEYWORDS = ("bedroom", "house", "property", "prefer")
+
+
 def update_user_profile(user_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
     """
     Update user profile with new information.
@@ -46,7 +52,8 @@ def update_user_profile(user_id: str, updates: Dict[str, Any]) -> Dict[str, Any]
         Update confirmation
     """
     # Mock realistic response for real estate preferences
-    if any(key in str(updates).lower() for key in ['bedroom', 'house', 'property', 'prefer']):
+    updates_text = str(updates).lower()
+    if any(keyword in updates_text for keyword in _REAL_ESTATE_KEYWORDS):
         return {
             "user_id": user_id,
             "status": "preference_saved",
@@ -69,6 +76,17 @@ def update_user_profile(user_id: str, updates: Dict[str, Any]) -> Dict[str, Any]
     }
 
 
+@lru_cache(maxsize=4096)
+def _cached_profile(user_id: str) -> Dict[str, Any]:
+    """
+    Profile lookup shared by the read-only helpers below.
+
+    Profiles are not persisted yet, so entries never go stale; once updates are stored this
+    cache must be invalidated on write. The returned dict is shared and must not be mutated.
+    """
+    return fetch_user_profile(user_id).get("profile", {})
+
+
 def get_user_preferences(user_id: str) -> Dict[str, Any]:
     """
     Get user preferences for personalization.
@@ -79,10 +97,14 @@ def get_user_preferences(user_id: str) -> Dict[str, Any]:
     Returns:
         User preferences
     """
-    profile = fetch_user_profile(user_id)
+    profile = _cached_profile(user_id)
+    preferences = dict(profile.get("preferences", {}))
+    # Copy the nested section too so callers cannot mutate the cached profile
+    if "notification_preferences" in preferences:
+        preferences["notification_preferences"] = dict(preferences["notification_preferences"])
     return {
         "user_id": user_id,
-        "preferences": profile.get("profile", {}).get("preferences", {}),
+        "preferences": preferences,
         "message": f"Preferences retrieved for user {user_id}",
     }
 
@@ -117,17 +139,16 @@ def get_personalization_data(user_id: str) -> Dict[str, Any]:
     Returns:
         Personalization data including preferences, context, and history
     """
-    profile = fetch_user_profile(user_id)
+    profile = _cached_profile(user_id)
+    preferences = profile.get("preferences", {})
 
     return {
         "user_id": user_id,
         "personalization": {
-            "communication_style": profile.get("profile", {})
-            .get("preferences", {})
-            .get("communication_style", "professional"),
-            "industry_context": profile.get("profile", {}).get("context", {}).get("industry", "general"),
-            "language": profile.get("profile", {}).get("preferences", {}).get("language", "en"),
-            "timezone": profile.get("profile", {}).get("preferences", {}).get("timezone", "UTC"),
+            "communication_style": preferences.get("communication_style", "professional"),
+            "industry_context": profile.get("context", {}).get("industry", "general"),
+            "language": preferences.get("language", "en"),
+            "timezone": preferences.get("timezone", "UTC"),
         },
         "message": f"Personalization data retrieved for user {user_id}",
     }
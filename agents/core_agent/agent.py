@@ -3,6 +3,9 @@ Core Agent - Shared core functionality and services
 This agent provides LLM, memory, and notification services for the multi-agent system
 """
 
+import asyncio
+from typing import Any
+
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 
@@ -11,35 +14,70 @@ from .llm_agent.agent import generate_reply, rewrite_text, summarize_text
 from .memory_agent.agent import delete_memory, retrieve_memory, store_memory, update_memory
 from .notifications.agent import get_notification_status, schedule_notification, send_alert, send_notification
 
+# Auto-detection keywords, checked in priority order
+_SERVICE_KEYWORDS = (
+    ("memory", ("remember", "recall")),
+    ("notification", ("notify", "alert")),
+)
+
+# Service type -> handler taking the raw request
+_SERVICE_HANDLERS = {
+    "llm": generate_reply,
+    "memory": retrieve_memory,
+    "notification": lambda request: send_notification(request, "user", "info"),
+}
+
+# Services whose handlers block on a model call; they run in a worker thread to keep the event loop free
+_BLOCKING_SERVICES = frozenset({"llm"})
+
+
+async def _run_service(service: str, request: str) -> Any:
+    """
+    Run a single core service handler.
+
+    Args:
+        service: Service type (llm, memory, notification, or anything else for a generic reply)
+        request: The user request or task
+
+    Returns:
+        Response from the service handler
+    """
+    handler = _SERVICE_HANDLERS.get(service)
+    if handler is None:
+        return await asyncio.to_thread(generate_reply, f"Processing request: {request}")
+    if service in _BLOCKING_SERVICES:
+        return await asyncio.to_thread(handler, request)
+    return handler(request)
+
 
-def coordinate_core_services(request: str, service_type: str = "auto") -> str:
+async def coordinate_core_services(request: str, service_type: str = "auto") -> Any:
     """
     Coordinate between core services based on the request type.
 
+    In auto mode every matching service is dispatched. Model-backed services run in a worker thread.
+
     Args:
         request: The user request or task
         service_type: Type of service needed (auto, llm, memory, notification)
 
     Returns:
-        Response from the appropriate core service
+        Response from the appropriate core service, or a dict of responses keyed by service when
+        the request matches several services
     """
     if service_type == "auto":
-        # Auto-detect the best service based on request content
-        if "remember" in request.lower() or "recall" in request.lower():
-            service_type = "memory"
-        elif "notify" in request.lower() or "alert" in request.lower():
-            service_type = "notification"
-        else:
-            service_type = "llm"
-
-    if service_type == "llm":
-        return generate_reply(request)
-    elif service_type == "memory":
-        return retrieve_memory(request)
-    elif service_type == "notification":
-        return send_notification(request, "user", "info")
+        # Auto-detect the services needed based on request content
+        request_lower = request.lower()
+        services = [
+            service for service, keywords in _SERVICE_KEYWORDS if any(keyword in request_lower for keyword in keywords)
+        ] or ["llm"]
     else:
-        return generate_reply(f"Processing request: {request}")
+        services = [service_type]
+
+    if len(services) == 1:
+        return await _run_service(services[0], request)
+
+    results = await asyncio.gather(*(_run_service(service, request) for service in services))
+    return dict(zip(services, results))
 
 
 def get_core_status() -> str:
@@ -47,30 +85,32 @@ def get_core_status() -> str:
     return "Core Agent: All services (LLM, Memory, Notifications) are operational"
 
 
-# Create the main core agent
-root_agent = Agent(
-    name="core_agent",
-    model="gemini-1.5-flash",
-    tools=[
+# Tools exposed by the Core Agent, grouped by service. Wrapped once at import so every
+# build_root_agent() call shares them instead of re-introspecting each signature
+_TOOLS = tuple(
+    FunctionTool(fn)
+    for fn in (
         # Main coordination function
-        FunctionTool(coordinate_core_services),
-        FunctionTool(get_core_status),
+        coordinate_core_services,
+        get_core_status,
         # LLM functions
-        FunctionTool(generate_reply),
-        FunctionTool(summarize_text),
-        FunctionTool(rewrite_text),
+        generate_reply,
+        summarize_text,
+        rewrite_text,
         # Memory functions
-        FunctionTool(store_memory),
-        FunctionTool(retrieve_memory),
-        FunctionTool(update_memory),
-        FunctionTool(delete_memory),
+        store_memory,
+        retrieve_memory,
+        update_memory,
+        delete_memory,
         # Notification functions
-        FunctionTool(send_notification),
-        FunctionTool(schedule_notification),
-        FunctionTool(get_notification_status),
-        FunctionTool(send_alert),
-    ],
-    instruction="""You are the Core Agent providing shared services for the multi-agent system.
+        send_notification,
+        schedule_notification,
+        get_notification_status,
+        send_alert,
+    )
+)
+
+_INSTRUCTION = """You are the Core Agent providing shared services for the multi-agent system.
     
     **Your role:** Provide core platform services including LLM, memory, and notifications.
     
@@ -93,5 +133,26 @@ root_agent = Agent(
     - Use coordinate_core_services for complex multi-service requests
     
     You are a reliable backend service agent focused on core platform functionality.
-    """,
-)
+    """
+
+
+def build_root_agent() -> Agent:
+    """
+    Build the Core Agent with all core service tools.
+
+    The agent holds configuration only: ADK keeps per-request state in the session and invocation
+    context, so a single instance can serve concurrent A2A requests.
+
+    Returns:
+        Configured Core Agent
+    """
+    return Agent(
+        name="core_agent",
+        model="gemini-1.5-flash",
+        tools=list(_TOOLS),
+        instruction=_INSTRUCTION,
+    )
+
+
+# Create the main core agent
+root_agent = build_root_agent()
@@ -24,4 +24,15 @@ if __name__ == "__main__":
 
     print("🧠 Starting Core Agent A2A Server on port 8001...")
     print("📋 Agent Card URL: http://localhost:8001/.well-known/agent.json")
-    uvicorn.run("agents.core_agent.expose_a2a:a2a_app", host="localhost", port=8001, reload=False)
+    uvicorn.run(
+        "agents.core_agent.expose_a2a:a2a_app",
+        host="localhost",
+        port=8001,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        # Each worker keeps its own in-memory A2A task and session store, so only raise this
+        # behind a sticky load balancer or with shared stores
+        workers=int(os.getenv("CORE_AGENT_WORKERS", "1")),
+    )
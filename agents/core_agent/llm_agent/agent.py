@@ -8,9 +8,16 @@ import sys
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 
+from .cache import llm_cache
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 from utils.llm import generate_reply, rewrite_text, summarize_text
 
+# Serve repeated identical prompts from the response cache instead of calling Gemini again
+generate_reply = llm_cache.wrap(generate_reply)
+summarize_text = llm_cache.wrap(summarize_text)
+rewrite_text = llm_cache.wrap(rewrite_text)
+
 # Create the LLM agent
 root_agent = Agent(
     name="llm_agent",
@@ -0,0 +1,110 @@
+"""Response cache for LLM helper calls to avoid repeated model round-trips for identical prompts."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# utils.llm reports failures as strings with this prefix instead of raising
+_ERROR_PREFIX = "Error generating response:"
+
+
+class LLMCache:
+    """
+    In-process LRU cache with a TTL for LLM helper responses.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Seconds a response stays valid; 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        """
+        Build a stable key for a helper call.
+
+        Args:
+            name: Qualified name of the wrapped helper
+            args: Positional call arguments
+            kwargs: Keyword call arguments
+
+        Returns:
+            SHA-256 hex digest of the call
+        """
+        payload = json.dumps([name, args, kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entries beyond maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def wrap(self, func: Callable[..., str]) -> Callable[..., str]:
+        """
+        Wrap an LLM helper so identical calls are answered from the cache.
+
+        Error responses are never cached. The wrapper keeps the helper's name, signature and
+        docstring so it can still be registered as a FunctionTool.
+
+        Args:
+            func: LLM helper returning the response text
+
+        Returns:
+            Caching wrapper around func
+        """
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> str:
+            if self.ttl <= 0:
+                return func(*args, **kwargs)
+
+            key = self.cache_key(func.__qualname__, args, kwargs)
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+
+            response = func(*args, **kwargs)
+            if isinstance(response, str) and not response.startswith(_ERROR_PREFIX):
+                self.set(key, response)
+            return response
+
+        return wrapper
+
+
+# Shared cache for the LLM agent helpers. Off by default: the helpers sample at the model's default
+# (non-zero) temperature, so reusing a response changes behaviour. Set LLM_CACHE_TTL_SECONDS to opt in.
+llm_cache = LLMCache(ttl=float(os.getenv("LLM_CACHE_TTL_SECONDS", "0")))
@@ -1,12 +1,22 @@
 """Notifications Agent for handling alerts and communication."""
 
+import itertools
 import json
+import time
 from datetime import datetime
 from typing import Any, Dict, List
 
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 
+# Per-process sequence appended to IDs so calls within the same nanosecond stay unique
+_COUNTER = itertools.count()
+
+
+def _new_id(prefix: str) -> str:
+    """Build a unique notification or alert ID from the wall clock and the process counter."""
+    return f"{prefix}_{time.time_ns()}_{next(_COUNTER)}"
+
 
 def send_notification(recipient: str, message: str, channel: str = "email", priority: str = "normal") -> Dict[str, Any]:
     """
@@ -21,18 +31,8 @@ def send_notification(recipient: str, message: str, channel: str = "email", prio
     Returns:
         Notification sending result
     """
-    notification = {
-        "id": f"notif_{datetime.now().timestamp()}",
-        "recipient": recipient,
-        "message": message,
-        "channel": channel,
-        "priority": priority,
-        "timestamp": datetime.now().isoformat(),
-        "status": "sent",
-    }
-
     return {
-        "notification_id": notification["id"],
+        "notification_id": _new_id("notif"),
         "status": "sent",
         "message": f"Notification sent to {recipient} via {channel}",
     }
@@ -52,7 +52,7 @@ def schedule_notification(recipient: str, message: str, schedule_time: str, chan
         Scheduling confirmation
     """
     return {
-        "notification_id": f"scheduled_{datetime.now().timestamp()}",
+        "notification_id": _new_id("scheduled"),
         "status": "scheduled",
         "delivery_time": schedule_time,
         "message": f"Notification scheduled for {recipient} at {schedule_time}",
@@ -89,16 +89,8 @@ def send_alert(alert_type: str, message: str, severity: str = "medium") -> Dict[
     Returns:
         Alert sending result
     """
-    alert = {
-        "id": f"alert_{datetime.now().timestamp()}",
-        "type": alert_type,
-        "message": message,
-        "severity": severity,
-        "timestamp": datetime.now().isoformat(),
-    }
-
     return {
-        "alert_id": alert["id"],
+        "alert_id": _new_id("alert"),
         "status": "sent",
         "message": f"{severity.upper()} {alert_type} alert sent to administrators",
     }
@@ -1,52 +1,74 @@
 """Domain Real Estate Agent with Coordinator for multi-agent orchestration."""
 
+import logging
 import os
+import re
 import sys
-from typing import Optional, Any, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Any, Dict, List, Tuple
 
 from google.adk import Agent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
 from google.adk.tools import FunctionTool
-from google.adk.agents.remote_a2a_agent import AGENT_CARD_WELL_KNOWN_PATH, RemoteA2aAgent
 from google.genai import types
 
-# Import utils with absolute path
+# Import utils with absolute path; the repo root is not an installed package, so utils still needs it on sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-from agents.domain_realestate.tools import crm_connector, lead_router
-from utils.memory import MemoryManager
+from utils.a2a import get_remote_agent
 
-# Initialize local components
-memory_manager = MemoryManager()
+from .tools import crm_connector, lead_router
 
-# Define remote A2A agents following official ADK pattern
-core_agent = RemoteA2aAgent(
-    name="core_agent",
-    description="Core Agent for notifications, logging, analytics, and shared services",
-    agent_card=f"http://localhost:8001{AGENT_CARD_WELL_KNOWN_PATH}",
-)
+logger = logging.getLogger(__name__)
 
-context_agent = RemoteA2aAgent(
-    name="context_agent",
-    description="Context Agent for user personalization, profiles, and session management",
-    agent_card=f"http://localhost:8002{AGENT_CARD_WELL_KNOWN_PATH}",
+# Request routing keywords by category
+_REAL_ESTATE_KEYWORDS = (
+    "property",
+    "house",
+    "home",
+    "real estate",
+    "buy",
+    "sell",
+    "rent",
+    "bedroom",
+    "bathroom",
+    "price",
+    "location",
+    "showing",
+    "lead",
+    "find me",
 )
+_CONTEXT_KEYWORDS = ("preference", "remember", "saved", "profile", "session", "history", "update my")
+_CORE_KEYWORDS = ("weather", "notification", "log", "report", "analytics", "trend")
 
+# Simple search filters: a maximum price ("under $500k", "under 2 million") and a minimum bedroom count
+# ("3 bedroom", "3+ beds", "2 bedrooms or more"). Any other number or bound means the filters are unclear.
+_MAX_PRICE_RE = re.compile(r"\bunder \$?(\d[\d,]*(?:\.\d+)?)\s*(thousand|million|k|m)?\b(?![\s-]*(?:bed|bath|br\b))")
+_BEDROOMS_RE = re.compile(r"(?<!under )\b(\d+)\s*(?:\+|or more)?[\s-]*(?:bed|br\b)")
+_UNCLEAR_FILTER_RE = re.compile(
+    r"\d|\b(?:under|below|over|above|between|less than|fewer than|more than|at most|no more than|up to|max)\b"
+)
+_PRICE_MULTIPLIERS = {"k": 1_000, "thousand": 1_000, "m": 1_000_000, "million": 1_000_000}
 
-def search_properties(query: str, max_price: float = 0.0, bedrooms: int = 0, location: str = "") -> str:
-    """
-    Search for properties based on criteria.
+# Define remote A2A agents following official ADK pattern
+core_agent = get_remote_agent(
+    "core_agent",
+    "Core Agent for notifications, logging, analytics, and shared services",
+    "http://localhost:8001",
+)
 
-    Args:
-        query: Search query for properties
-        max_price: Maximum price filter
-        bedrooms: Number of bedrooms
-        location: Location filter
+context_agent = get_remote_agent(
+    "context_agent",
+    "Context Agent for user personalization, profiles, and session management",
+    "http://localhost:8002",
+)
 
-    Returns:
-        Formatted property search results
-    """
 
-    # Mock property search - replace with actual MLS/property API
-    properties = [
+# Mock property catalog - replace with actual MLS/property API; read-only records built once at import
+_PROPERTIES = tuple(
+    MappingProxyType(prop)
+    for prop in (
         {
             "id": "PROP001",
             "address": "123 Main St, Downtown",
@@ -65,32 +87,65 @@ def search_properties(query: str, max_price: float = 0.0, bedrooms: int = 0, loc
             "sqft": 2200,
             "description": "Spacious family home with large backyard",
         },
-    ]
+    )
+)
+
+# Lowercased addresses aligned with _PROPERTIES for the location filter
+_ADDRESSES_LOWER = tuple(prop["address"].lower() for prop in _PROPERTIES)
+
+# Formatted search-result block for each property, aligned with _PROPERTIES
+_PROPERTY_BLOCKS = tuple(
+    f" {prop['address']}\n"
+    f"   ${prop['price']:,}\n"
+    f"   {prop['bedrooms']} bed, {prop['bathrooms']} bath\n"
+    f"   {prop['sqft']} sqft\n"
+    f"   {prop['description']}\n\n"
+    for prop in _PROPERTIES
+)
+
+
+def search_properties(query: str, max_price: float = 0.0, bedrooms: int = 0, location: str = "") -> str:
+    """
+    Search for properties based on criteria.
+
+    Args:
+        query: Search query for properties
+        max_price: Maximum price filter
+        bedrooms: Minimum number of bedrooms
+        location: Location filter
+
+    Returns:
+        Formatted property search results
+    """
 
     # Filter properties based on criteria
-    filtered_properties = []
-    for prop in properties:
+    location_lower = location.lower()
+    matches = []
+    for prop, address_lower, block in zip(_PROPERTIES, _ADDRESSES_LOWER, _PROPERTY_BLOCKS):
         if max_price > 0 and prop["price"] > max_price:
             continue
-        if bedrooms > 0 and prop["bedrooms"] != bedrooms:
+        if bedrooms > 0 and prop["bedrooms"] < bedrooms:
             continue
-        if location and location.lower() not in prop["address"].lower():
+        if location_lower and location_lower not in address_lower:
             continue
-        filtered_properties.append(prop)
+        matches.append(block)
 
-    if not filtered_properties:
+    if not matches:
         return "No properties found matching your criteria."
 
-    # Format results
-    result = f"Found {len(filtered_properties)} properties:\n\n"
-    for prop in filtered_properties:
-        result += f" {prop['address']}\n"
-        result += f"   ${prop['price']:,}\n"
-        result += f"   {prop['bedrooms']} bed, {prop['bathrooms']} bath\n"
-        result += f"   {prop['sqft']} sqft\n"
-        result += f"   {prop['description']}\n\n"
+    return f"Found {len(matches)} properties:\n\n" + "".join(matches)
 
-    return result
+
+# Confirmation messages for the lead and showing tools
+_LEAD_TEMPLATE = (
+    " Lead created successfully!\n\n"
+    "Lead ID: {lead_id}\nName: {name}\nEmail: {email}\nPhone: {phone}\nInterest: {property_interest}\n\n"
+    "Next steps: Our agent will contact you within 24 hours."
+)
+_SHOWING_TEMPLATE = (
+    "Property showing scheduled for {property_id} with lead {lead_id} on {preferred_date} at {preferred_time}. "
+    "Confirmation sent to lead."
+)
 
 
 def create_lead(name: str, email: str, phone: str, property_interest: str, notes: Optional[str] = None) -> str:
@@ -111,7 +166,9 @@ def create_lead(name: str, email: str, phone: str, property_interest: str, notes
         name=name, email=email, phone=phone, property_interest=property_interest, notes=notes or ""
     )
 
-    return f" Lead created successfully!\n\nLead ID: {lead_id}\nName: {name}\nEmail: {email}\nPhone: {phone}\nInterest: {property_interest}\n\nNext steps: Our agent will contact you within 24 hours."
+    return _LEAD_TEMPLATE.format(
+        lead_id=lead_id, name=name, email=email, phone=phone, property_interest=property_interest
+    )
 
 
 def schedule_showing(property_id: str, lead_id: str, preferred_date: str, preferred_time: str) -> str:
@@ -127,9 +184,60 @@ def schedule_showing(property_id: str, lead_id: str, preferred_date: str, prefer
     Returns:
         Showing confirmation
     """
-    showing_id = f"SHOW_{property_id}_{lead_id}"
+    return _SHOWING_TEMPLATE.format(
+        property_id=property_id, lead_id=lead_id, preferred_date=preferred_date, preferred_time=preferred_time
+    )
+
+
+@lru_cache(maxsize=4096)
+def _classify(user_msg_lower: str) -> str:
+    """
+    Classify a lowercased user message for routing.
+
+    Args:
+        user_msg_lower: Lowercased user message
 
-    return f"Property showing scheduled for {property_id} with lead {lead_id} on {preferred_date} at {preferred_time}. Confirmation sent to lead."
+    Returns:
+        Route name: property_search, context, core or default
+    """
+    is_real_estate_query = any(keyword in user_msg_lower for keyword in _REAL_ESTATE_KEYWORDS)
+    if is_real_estate_query and ("search" in user_msg_lower or "find" in user_msg_lower):
+        return "property_search"
+    if any(keyword in user_msg_lower for keyword in _CONTEXT_KEYWORDS):
+        return "context"
+    if any(keyword in user_msg_lower for keyword in _CORE_KEYWORDS):
+        return "core"
+    return "default"
+
+
+def _parse_search_filters(user_msg_lower: str) -> Optional[Tuple[float, int]]:
+    """
+    Extract simple property search filters from a lowercased user message.
+
+    Args:
+        user_msg_lower: Lowercased user message
+
+    Returns:
+        Tuple of (max_price, min_bedrooms), each 0 when not mentioned, or None when the message has
+        numbers or bounds these filters cannot express
+    """
+    rest = user_msg_lower
+    max_price = 0.0
+    price_match = _MAX_PRICE_RE.search(rest)
+    if price_match:
+        amount, suffix = price_match.groups()
+        max_price = float(amount.replace(",", "")) * _PRICE_MULTIPLIERS.get(suffix, 1)
+        rest = rest[: price_match.start()] + " " + rest[price_match.end() :]
+
+    bedrooms = 0
+    bedrooms_match = _BEDROOMS_RE.search(rest)
+    if bedrooms_match:
+        bedrooms = int(bedrooms_match.group(1))
+        rest = rest[: bedrooms_match.start()] + " " + rest[bedrooms_match.end() :]
+
+    if _UNCLEAR_FILTER_RE.search(rest):
+        return None
+    return max_price, bedrooms
 
 
 async def coordinate_request(user_message: str, session_id: Optional[str] = None) -> str:
@@ -153,38 +261,22 @@ async def coordinate_request(user_message: str, session_id: Optional[str] = None
         
         # Determine query type and route accordingly
         user_msg_lower = user_message.lower()
+        route = _classify(user_msg_lower)
         
-        # Check for real estate queries
-        is_real_estate_query = any(keyword in user_msg_lower for keyword in [
-            "property", "house", "home", "real estate", "buy", "sell", "rent", 
-            "bedroom", "bathroom", "price", "location", "showing", "lead", "find me"
-        ])
-        
-        # Check for context/preference queries
-        is_context_query = any(keyword in user_msg_lower for keyword in [
-            "preference", "remember", "saved", "profile", "session", "history", "update my"
-        ])
-        
-        # Check for general/core queries
-        is_core_query = any(keyword in user_msg_lower for keyword in [
-            "weather", "notification", "log", "report", "analytics", "trend"
-        ])
-        
-        if is_real_estate_query and ("search" in user_msg_lower or "find" in user_msg_lower):
+        if route == "property_search":
             # Handle property search locally
-            result = search_properties(user_message, 0.0, 0, "")
+            max_price, bedrooms = _parse_search_filters(user_msg_lower) or (0.0, 0)
+            result = search_properties(user_message, max_price, bedrooms, "")
             
             # Log activity via Core Agent
             try:
-                await core_agent.send_message(
-                    f"Log property search activity: {user_message}"
-                )
+                await core_agent.send_message(f"Log property search activity: {user_message}")
             except Exception as e:
-                print(f"Core Agent logging failed: {e}")
+                logger.warning("Core Agent logging failed: %s", e)
             
             return result
             
-        elif is_context_query:
+        elif route == "context":
             # Route to Context Agent with default user_id
             try:
                 context_response = await context_agent.send_message(
@@ -194,7 +286,7 @@ async def coordinate_request(user_message: str, session_id: Optional[str] = None
             except Exception as e:
                 return f"Context Agent error: {str(e)}"
                 
-        elif is_core_query:
+        elif route == "core":
             # Route to Core Agent for general queries
             try:
                 core_response = await core_agent.send_message(user_message)
@@ -221,19 +313,51 @@ async def coordinate_request(user_message: str, session_id: Optional[str] = None
         return f"Error coordinating request: {str(e)}"
 
 
-# Create the Domain Real Estate agent (Main orchestrator following ADK standards)
-root_agent = Agent(
-    name="domain_realestate",
-    model="gemini-1.5-flash",
-    tools=[
-        # Multi-agent Coordination
-        FunctionTool(coordinate_request),
-        # CRM and Lead Management Tools
-        FunctionTool(search_properties),
-        FunctionTool(create_lead),
-        FunctionTool(schedule_showing),
-    ],
-    instruction="""You are the Domain Real Estate Agent with Coordinator capabilities for multi-agent orchestration.
+async def _shortcut_property_search(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Answer keyword-obvious property searches without calling the model.
+
+    Runs as the agent's before_model_callback. When the latest user message is classified as a property
+    search, coordinate_request handles it directly, which saves the tool-selection and formatting model calls.
+
+    Args:
+        callback_context: Callback context for the current invocation
+        llm_request: Request about to be sent to the model
+
+    Returns:
+        The search response, or None to let the model handle the request
+    """
+    if not llm_request.contents:
+        return None
+    latest = llm_request.contents[-1]
+    if latest.role != "user" or not latest.parts:
+        return None
+
+    # Function responses also arrive as user content but carry no text
+    user_message = "".join(part.text or "" for part in latest.parts).strip()
+    if not user_message or _classify(user_message.lower()) != "property_search":
+        return None
+    # Leave searches with filters we cannot parse reliably to the model
+    if _parse_search_filters(user_message.lower()) is None:
+        return None
+
+    result = await coordinate_request(user_message)
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=result)]))
+
+
+# Agent tools, built at import and reused rather than wrapped again per agent
+_TOOLS = (
+    # Multi-agent Coordination
+    FunctionTool(coordinate_request),
+    # CRM and Lead Management Tools
+    FunctionTool(search_properties),
+    FunctionTool(create_lead),
+    FunctionTool(schedule_showing),
+)
+
+_INSTRUCTION = """You are the Domain Real Estate Agent with Coordinator capabilities for multi-agent orchestration.
     
     **CRITICAL: For ALL user requests, FIRST use the coordinate_request function to handle proper routing and orchestration.**
     
@@ -257,6 +381,16 @@ root_agent = Agent(
     - "Find me houses" → coordinate_request → Local search_properties
     - "Log my activity" → coordinate_request → Core Agent A2A
     
-    **NEVER respond directly without using coordinate_request first!**""",
-    global_instruction="You are the Domain Real Estate Agent with Coordinator capabilities. CRITICAL: For ALL user requests, FIRST use the coordinate_request function to handle proper routing and orchestration. This function will intelligently route requests to Core Agent (general queries), Context Agent (preferences/session), or handle real estate queries locally. NEVER respond directly without using coordinate_request first!",
+    **NEVER respond directly without using coordinate_request first!**"""
+
+_GLOBAL_INSTRUCTION = "You are the Domain Real Estate Agent with Coordinator capabilities. CRITICAL: For ALL user requests, FIRST use the coordinate_request function to handle proper routing and orchestration. This function will intelligently route requests to Core Agent (general queries), Context Agent (preferences/session), or handle real estate queries locally. NEVER respond directly without using coordinate_request first!"
+
+# Create the Domain Real Estate agent (Main orchestrator following ADK standards)
+root_agent = Agent(
+    name="domain_realestate",
+    model="gemini-1.5-flash",
+    tools=list(_TOOLS),
+    instruction=_INSTRUCTION,
+    global_instruction=_GLOBAL_INSTRUCTION,
+    before_model_callback=_shortcut_property_search,
 )
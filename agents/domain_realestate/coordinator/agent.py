@@ -7,28 +7,24 @@ from typing import Any, Dict, List
 
 # ADK imports following official pattern
 from google.adk.agents.llm_agent import Agent
-from google.adk.agents.remote_a2a_agent import AGENT_CARD_WELL_KNOWN_PATH, RemoteA2aAgent
 from google.adk.tools.example_tool import ExampleTool
 from google.genai import types
 
 # Import utils with absolute path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
-from utils.memory import MemoryManager
-
-# Initialize local components
-memory_manager = MemoryManager()
+from utils.a2a import get_remote_agent
 
 # Define remote A2A agents following official ADK pattern
-domain_realestate_agent = RemoteA2aAgent(
-    name="domain_realestate",
-    description="Domain Real Estate Agent for property search, lead management, and CRM integration",
-    agent_card=f"http://localhost:8001{AGENT_CARD_WELL_KNOWN_PATH}",
+domain_realestate_agent = get_remote_agent(
+    "domain_realestate",
+    "Domain Real Estate Agent for property search, lead management, and CRM integration",
+    "http://localhost:8001",
 )
 
-context_agent = RemoteA2aAgent(
-    name="context_agent",
-    description="Context Agent for user personalization, profiles, and session management",
-    agent_card=f"http://localhost:8002{AGENT_CARD_WELL_KNOWN_PATH}",
+context_agent = get_remote_agent(
+    "context_agent",
+    "Context Agent for user personalization, profiles, and session management",
+    "http://localhost:8002",
 )
 
 # Create example tool for context
@@ -1,8 +1,7 @@
 """CRM Connector for real estate lead management and integration."""
 
-import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 
 def create_lead(
@@ -22,7 +21,8 @@ def create_lead(
     Returns:
         Lead creation result
     """
-    lead_id = f"lead_{datetime.now().timestamp()}"
+    now = datetime.now()
+    lead_id = f"lead_{now.timestamp()}"
 
     lead_data = {
         "lead_id": lead_id,
@@ -34,7 +34,7 @@ def create_lead(
         "notes": notes,
         "status": "new",
         "source": "ai_agent",
-        "created_at": datetime.now().isoformat(),
+        "created_at": now.isoformat(),
         "assigned_agent": None,
         "follow_up_date": None,
     }
@@ -121,7 +121,7 @@ def search_properties_crm(
         location: Location/area to search
         min_price: Minimum price filter
         max_price: Maximum price filter
-        bedrooms: Number of bedrooms
+        bedrooms: Minimum number of bedrooms
 
     Returns:
         Property search results
@@ -149,6 +149,13 @@ def search_properties_crm(
             "description": f"Spacious {property_type} in {location}",
         },
     ]
+    sample_properties = [
+        prop
+        for prop in sample_properties
+        if (min_price is None or prop["price"] >= min_price)
+        and (max_price is None or prop["price"] <= max_price)
+        and (bedrooms is None or prop["bedrooms"] >= bedrooms)
+    ]
 
     return {
         "search_criteria": {
@@ -176,7 +183,8 @@ def schedule_showing(property_id: str, lead_id: str, preferred_time: str) -> Dic
     Returns:
         Showing scheduling result
     """
-    showing_id = f"showing_{datetime.now().timestamp()}"
+    now = datetime.now()
+    showing_id = f"showing_{now.timestamp()}"
 
     return {
         "showing_id": showing_id,
@@ -184,6 +192,6 @@ def schedule_showing(property_id: str, lead_id: str, preferred_time: str) -> Dic
         "lead_id": lead_id,
         "scheduled_time": preferred_time,
         "status": "scheduled",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "message": f"Property showing scheduled for {preferred_time}",
     }
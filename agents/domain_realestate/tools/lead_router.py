@@ -1,29 +1,67 @@
 """Lead Router for intelligent lead routing and qualification."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import heapq
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
+# Budget amount with an optional thousand/million suffix, e.g. "$450k", "1.2M" or "350,000"
+_BUDGET_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([km])?", re.IGNORECASE)
+_BUDGET_MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
 
-def qualify_lead(lead_data: Dict[str, Any], qualification_criteria: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+
+def _default_criteria() -> Dict[str, Any]:
+    """Return the qualification criteria used when the caller does not supply its own."""
+    return {
+        "budget_minimum": 200000,
+        "required_fields": ["name", "email", "phone"],
+        "property_types": ["house", "condo", "apartment", "townhouse"],
+    }
+
+
+# Budget bands (inclusive, non-overlapping) that earn a routing bonus for agents with the matching specialty
+_BUDGET_BONUS_BANDS = (
+    ("luxury", 500_000, float("inf")),
+    ("first-time", 200_000, 300_000),
+)
+_BUDGET_BONUS = 20
+
+
+def _budget_specialty(budget_num: float) -> Optional[str]:
+    """Return the specialty whose budget band contains budget_num, if any."""
+    return next((specialty for specialty, low, high in _BUDGET_BONUS_BANDS if low <= budget_num <= high), None)
+
+
+def _parse_budget(budget_range: str) -> float:
     """
-    Qualify a lead based on predefined criteria.
+    Parse the dollar amount from a budget string.
+
+    For ranges such as "200k-300k" the lower bound is used.
 
     Args:
-        lead_data: Lead information dictionary
-        qualification_criteria: Custom qualification criteria
+        budget_range: Budget as entered for the lead
 
     Returns:
-        Lead qualification result
+        Budget in dollars, or 0.0 if no amount is present
     """
-    default_criteria = {
-        "budget_minimum": 200000,
-        "required_fields": ["name", "email", "phone"],
-        "property_types": ["house", "condo", "apartment", "townhouse"],
-    }
+    match = _BUDGET_RE.search(budget_range)
+    if not match:
+        return 0.0
+    amount, suffix = match.groups()
+    return float(amount.replace(",", "")) * _BUDGET_MULTIPLIERS.get((suffix or "").lower(), 1)
+
+
+def _score_lead(lead_data: Dict[str, Any], criteria: Dict[str, Any]) -> Tuple[float, bool, bool]:
+    """
+    Score a lead against qualification criteria.
+
+    Args:
+        lead_data: Lead information dictionary
+        criteria: Qualification criteria
 
-    criteria = qualification_criteria or default_criteria
+    Returns:
+        Tuple of (score, all required fields present, property type matched)
+    """
     score = 0
-    max_score = 100
 
     # Check required fields
     required_fields = criteria.get("required_fields", [])
@@ -32,30 +70,65 @@ def qualify_lead(lead_data: Dict[str, Any], qualification_criteria: Optional[Dic
         score += (fields_present / len(required_fields)) * 30
 
     # Check budget qualification
-    budget_range = lead_data.get("budget_range", "")
-    if budget_range and "k" in budget_range.lower():
-        try:
-            budget_num = float(budget_range.lower().replace("k", "").replace("$", "").strip()) * 1000
-            if budget_num >= criteria.get("budget_minimum", 0):
-                score += 40
-        except:
-            pass
+    budget_num = _parse_budget(lead_data.get("budget_range") or "")
+    if budget_num and budget_num >= criteria.get("budget_minimum", 0):
+        score += 40
 
     # Check property interest
-    property_interest = lead_data.get("property_interest", "").lower()
-    if property_interest in criteria.get("property_types", []):
+    property_match = lead_data.get("property_interest", "").lower() in criteria.get("property_types", [])
+    if property_match:
         score += 30
 
-    qualification_level = "high" if score >= 80 else "medium" if score >= 50 else "low"
+    return score, fields_present == len(required_fields), property_match
+
+
+def _missing_fields(lead_data: Dict[str, Any], criteria: Dict[str, Any]) -> List[str]:
+    """Return the required fields that are empty or absent in a lead."""
+    return [field for field in criteria.get("required_fields", []) if not lead_data.get(field)]
+
+
+def _qualification_level(score: float) -> str:
+    """Map a qualification score to its priority level."""
+    return "high" if score >= 80 else "medium" if score >= 50 else "low"
+
+
+def qualify_lead(lead_data: Dict[str, Any], qualification_criteria: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Qualify a lead based on predefined criteria.
+
+    Args:
+        lead_data: Lead information dictionary
+        qualification_criteria: Custom qualification criteria
+
+    Returns:
+        Lead qualification result
+    """
+    criteria = qualification_criteria or _default_criteria()
+
+    # Disqualify incomplete leads before scoring
+    missing = _missing_fields(lead_data, criteria)
+    if missing:
+        filter_reason = f"Missing required fields: {', '.join(missing)}"
+        return {
+            "lead_id": lead_data.get("lead_id", "unknown"),
+            "qualification_score": 0,
+            "qualification_level": "disqualified",
+            "criteria_met": {"required_fields": False, "budget_qualified": False, "property_match": False},
+            "filter_reason": filter_reason,
+            "message": f"Lead disqualified: {filter_reason}",
+        }
+
+    score, required_fields_met, property_match = _score_lead(lead_data, criteria)
+    qualification_level = _qualification_level(score)
 
     return {
         "lead_id": lead_data.get("lead_id", "unknown"),
         "qualification_score": score,
         "qualification_level": qualification_level,
         "criteria_met": {
-            "required_fields": fields_present == len(required_fields),
+            "required_fields": required_fields_met,
             "budget_qualified": score >= 40,
-            "property_match": property_interest in criteria.get("property_types", []),
+            "property_match": property_match,
         },
         "message": f"Lead qualified as {qualification_level} priority (score: {score}/100)",
     }
@@ -93,7 +166,7 @@ def route_lead_to_agent(lead_data: Dict[str, Any], available_agents: Optional[Li
 
     agents = available_agents or default_agents
     property_interest = lead_data.get("property_interest", "").lower()
-    budget_range = lead_data.get("budget_range", "")
+    budget_specialty = _budget_specialty(_parse_budget(lead_data.get("budget_range") or ""))
 
     # Simple routing logic - in production this would be more sophisticated
     best_agent = None
@@ -114,10 +187,8 @@ def route_lead_to_agent(lead_data: Dict[str, Any], available_agents: Optional[Li
         score += load_factor * 30
 
         # Budget consideration
-        if "luxury" in agent["specialties"] and "500k" in budget_range:
-            score += 20
-        elif "first-time" in agent["specialties"] and any(x in budget_range for x in ["200k", "300k"]):
-            score += 20
+        if budget_specialty in agent["specialties"]:
+            score += _BUDGET_BONUS
 
         if score > best_score:
             best_score = score
@@ -128,7 +199,7 @@ def route_lead_to_agent(lead_data: Dict[str, Any], available_agents: Optional[Li
             "lead_id": lead_data.get("lead_id"),
             "assigned_agent": best_agent,
             "routing_score": best_score,
-            "routing_reason": f"Best match based on specialty and availability",
+            "routing_reason": "Best match based on specialty and availability",
             "status": "routed",
             "message": f"Lead routed to {best_agent['name']} (Agent ID: {best_agent['agent_id']})",
         }
@@ -141,21 +212,32 @@ def route_lead_to_agent(lead_data: Dict[str, Any], available_agents: Optional[Li
         }
 
 
-def prioritize_leads(leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+def prioritize_leads(leads: List[Dict[str, Any]], top_k: Optional[int] = None) -> Dict[str, Any]:
     """
     Prioritize a list of leads based on qualification and urgency.
 
     Args:
         leads: List of lead dictionaries
+        top_k: Only return the top_k highest-priority leads (all leads when omitted)
 
     Returns:
         Prioritized lead list
     """
+    criteria = _default_criteria()
     prioritized = []
+    high_priority = 0
 
     for lead in leads:
-        qualification = qualify_lead(lead)
-        priority_score = qualification["qualification_score"]
+        # Disqualified leads sink to the bottom without scoring
+        if _missing_fields(lead, criteria):
+            prioritized.append({**lead, "priority_score": 0, "qualification_level": "disqualified"})
+            continue
+
+        # Score directly instead of building the full qualify_lead result for each lead
+        priority_score, _, _ = _score_lead(lead, criteria)
+        qualification_level = _qualification_level(priority_score)
+        if qualification_level == "high":
+            high_priority += 1
 
         # Add urgency factors
         created_at = lead.get("created_at", "")
@@ -163,19 +245,18 @@ def prioritize_leads(leads: List[Dict[str, Any]]) -> Dict[str, Any]:
             # Recent leads get higher priority
             priority_score += 10
 
-        lead_with_priority = {
-            **lead,
-            "priority_score": priority_score,
-            "qualification_level": qualification["qualification_level"],
-        }
-        prioritized.append(lead_with_priority)
+        prioritized.append({**lead, "priority_score": priority_score, "qualification_level": qualification_level})
 
-    # Sort by priority score (highest first)
-    prioritized.sort(key=lambda x: x["priority_score"], reverse=True)
+    # Sort by priority score (highest first); a bounded heap avoids sorting everything when only the top is needed
+    total_leads = len(prioritized)
+    if top_k is not None and top_k < total_leads:
+        prioritized = heapq.nlargest(top_k, prioritized, key=lambda x: x["priority_score"])
+    else:
+        prioritized.sort(key=lambda x: x["priority_score"], reverse=True)
 
     return {
         "prioritized_leads": prioritized,
-        "total_leads": len(prioritized),
-        "high_priority": len([l for l in prioritized if l["qualification_level"] == "high"]),
-        "message": f"Prioritized {len(prioritized)} leads",
+        "total_leads": total_leads,
+        "high_priority": high_priority,
+        "message": f"Prioritized {total_leads} leads",
     }
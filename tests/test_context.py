@@ -31,6 +31,17 @@ class TestProfileManager:
         assert "preferences" in result["profile"]
         assert "context" in result["profile"]
 
+    def test_fetch_user_profile_independent(self):
+        """Test that default profiles do not share mutable state between users."""
+        first = fetch_user_profile("carol")["profile"]
+        first["context"]["interests"].append("condos")
+        first["preferences"]["notification_preferences"]["sms"] = True
+
+        second = fetch_user_profile("dave")["profile"]
+
+        assert second["context"]["interests"] == []
+        assert second["preferences"]["notification_preferences"]["sms"] is False
+
     def test_update_user_profile(self):
         """Test user profile updating."""
         updates = {"name": "John Doe", "preferences": {"communication_style": "casual"}}
@@ -42,6 +53,12 @@ class TestProfileManager:
         assert "updated_fields" in result
         assert len(result["updated_fields"]) == 2
 
+    def test_update_user_profile_nested_preferences(self):
+        """Test that real estate keywords are found in nested update values."""
+        assert update_user_profile("test_user_123", {"criteria": {"bedrooms": 3}})["status"] == "preference_saved"
+        assert update_user_profile("test_user_123", {"notes": ["house near school"]})["status"] == "preference_saved"
+        assert update_user_profile("test_user_123", {"name": "John Doe"})["status"] == "updated"
+
     def test_get_user_preferences(self):
         """Test user preferences retrieval."""
         result = get_user_preferences("test_user_123")
@@ -50,6 +67,17 @@ class TestProfileManager:
         assert result["user_id"] == "test_user_123"
         assert isinstance(result["preferences"], dict)
 
+    def test_get_user_preferences_cached_copy(self):
+        """Test cached preferences are returned as independent copies."""
+        first = get_user_preferences("cached_user")
+        first["preferences"]["language"] = "th"
+        first["preferences"]["notification_preferences"]["sms"] = True
+
+        second = get_user_preferences("cached_user")
+
+        assert second["preferences"]["language"] == "en"
+        assert second["preferences"]["notification_preferences"]["sms"] is False
+
     def test_update_user_context(self):
         """Test user context updating."""
         context_data = {"industry": "real_estate", "role": "buyer", "interests": ["houses", "condos"]}
@@ -2,12 +2,16 @@
 
 import os
 import sys
+import threading
 
 import pytest
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from agents.core_agent import agent as core_agent_module
+from agents.core_agent.agent import coordinate_core_services
+from agents.core_agent.llm_agent.cache import LLMCache
 from agents.core_agent.memory_agent.agent import root_agent as memory_agent
 from agents.core_agent.notifications.agent import root_agent as notifications_agent
 from utils.llm import generate_reply, rewrite_text, summarize_text
@@ -37,6 +41,54 @@ class TestLLMUtilities:
         assert len(result) > 0
 
 
+class TestLLMCache:
+    """Test LLM response cache."""
+
+    def test_repeated_prompt_served_from_cache(self):
+        """Test identical calls hit the wrapped function once."""
+        calls = []
+
+        def reply(prompt: str) -> str:
+            calls.append(prompt)
+            return f"reply to {prompt}"
+
+        cached_reply = LLMCache(ttl=60).wrap(reply)
+
+        assert cached_reply("hello") == "reply to hello"
+        assert cached_reply("hello") == "reply to hello"
+        assert cached_reply("other") == "reply to other"
+        assert calls == ["hello", "other"]
+        assert cached_reply.__name__ == "reply"
+
+    def test_errors_not_cached(self):
+        """Test error responses are retried instead of cached."""
+        calls = []
+
+        def reply(prompt: str) -> str:
+            calls.append(prompt)
+            return "Error generating response: quota exceeded"
+
+        cached_reply = LLMCache(ttl=60).wrap(reply)
+        cached_reply("hello")
+        cached_reply("hello")
+
+        assert len(calls) == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a zero TTL bypasses the cache."""
+        calls = []
+
+        def reply(prompt: str) -> str:
+            calls.append(prompt)
+            return "ok"
+
+        cached_reply = LLMCache(ttl=0).wrap(reply)
+        cached_reply("hello")
+        cached_reply("hello")
+
+        assert len(calls) == 2
+
+
 class TestMemoryAgent:
     """Test memory agent functionality."""
 
@@ -57,6 +109,26 @@ class TestNotificationsAgent:
         assert len(notifications_agent.tools) > 0
 
 
+class TestCoreCoordination:
+    """Test core service coordination."""
+
+    @pytest.mark.asyncio
+    async def test_multi_service_request_fans_out(self):
+        """Test that a request matching several services dispatches to each of them."""
+        result = await coordinate_core_services("remember to notify me about the viewing")
+
+        assert set(result) == {"memory", "notification"}
+        assert "memories" in result["memory"]
+        assert result["notification"]["status"] == "sent"
+
+    @pytest.mark.asyncio
+    async def test_llm_service_runs_off_event_loop(self, monkeypatch):
+        """Test that the model-backed llm service does not run on the event loop thread."""
+        monkeypatch.setitem(core_agent_module._SERVICE_HANDLERS, "llm", lambda request: threading.get_ident())
+
+        assert await coordinate_core_services("hello", service_type="llm") != threading.get_ident()
+
+
 def test_agent_integration():
     """Test basic agent integration."""
     # This would test actual agent communication in a real environment
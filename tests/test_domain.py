@@ -4,10 +4,19 @@ import os
 import sys
 
 import pytest
+from google.adk.models import LlmRequest
+from google.genai import types
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from agents.domain_realestate import agent as domain_agent
+from agents.domain_realestate.agent import (
+    _classify,
+    _parse_search_filters,
+    _shortcut_property_search,
+    coordinate_request,
+)
 from agents.domain_realestate.tools.crm_connector import (
     create_lead,
     get_lead,
@@ -15,7 +24,22 @@ from agents.domain_realestate.tools.crm_connector import (
     search_properties_crm,
     update_lead,
 )
-from agents.domain_realestate.tools.lead_router import prioritize_leads, qualify_lead, route_lead_to_agent
+from agents.domain_realestate.tools.lead_router import _parse_budget, prioritize_leads, qualify_lead, route_lead_to_agent
+
+
+class StubRemoteAgent:
+    """Remote agent stand-in that records the messages it is sent."""
+
+    def __init__(self, reply="ok", fail=False):
+        self.reply = reply
+        self.fail = fail
+        self.messages = []
+
+    async def send_message(self, message):
+        self.messages.append(message)
+        if self.fail:
+            raise RuntimeError("peer unavailable")
+        return self.reply
 
 
 class TestCRMConnector:
@@ -48,6 +72,19 @@ class TestCRMConnector:
         assert isinstance(result["results"], list)
         assert result["count"] >= 0
 
+    def test_search_properties_filters(self):
+        """Test that price and bedroom filters are applied."""
+        result = search_properties_crm(
+            property_type="house", location="downtown", min_price=300000, max_price=500000, bedrooms=3
+        )
+
+        assert [prop["property_id"] for prop in result["results"]] == ["prop_001"]
+        assert result["count"] == 1
+
+        result = search_properties_crm(property_type="house", location="downtown", bedrooms=4)
+
+        assert [prop["property_id"] for prop in result["results"]] == ["prop_002"]
+
     def test_schedule_showing(self):
         """Test property showing scheduling."""
         result = schedule_showing(property_id="prop_001", lead_id="lead_123", preferred_time="2024-01-15 14:00")
@@ -78,6 +115,14 @@ class TestLeadRouter:
         assert result["qualification_score"] >= 0
         assert result["qualification_level"] in ["low", "medium", "high"]
 
+    def test_qualify_lead_missing_fields(self):
+        """Test that leads missing required fields are disqualified before scoring."""
+        result = qualify_lead({"lead_id": "test_lead", "name": "Jane Smith", "budget_range": "500k"})
+
+        assert result["qualification_level"] == "disqualified"
+        assert result["qualification_score"] == 0
+        assert result["filter_reason"] == "Missing required fields: email, phone"
+
     def test_route_lead_to_agent(self):
         """Test lead routing to agents."""
         lead_data = {"lead_id": "test_lead", "property_interest": "house", "budget_range": "400k"}
@@ -87,6 +132,29 @@ class TestLeadRouter:
         assert "status" in result
         assert result["status"] in ["routed", "unrouted"]
 
+    def test_parse_budget(self):
+        """Test budget parsing for suffixed, plain and range amounts."""
+        assert _parse_budget("$450k") == 450000
+        assert _parse_budget("1.2M") == 1200000
+        assert _parse_budget("350,000") == 350000
+        assert _parse_budget("200k-300k") == 200000
+        assert _parse_budget("flexible") == 0.0
+
+    def test_missing_budget(self):
+        """Test that a lead with no budget is scored without the budget points."""
+        lead_data = {
+            "lead_id": "test_lead",
+            "name": "Jane Smith",
+            "email": "jane@example.com",
+            "phone": "555-5678",
+            "property_interest": "house",
+            "budget_range": None,
+        }
+
+        assert qualify_lead(lead_data)["qualification_level"] == "medium"
+        assert prioritize_leads([lead_data])["total_leads"] == 1
+        assert route_lead_to_agent(lead_data)["status"] == "routed"
+
     def test_prioritize_leads(self):
         """Test lead prioritization."""
         leads = [
@@ -117,6 +185,88 @@ class TestLeadRouter:
         assert len(result["prioritized_leads"]) == 2
         assert result["total_leads"] == 2
 
+        top = prioritize_leads(leads, top_k=1)
+
+        assert top["total_leads"] == 2
+        assert [lead["lead_id"] for lead in top["prioritized_leads"]] == [result["prioritized_leads"][0]["lead_id"]]
+
+
+class TestRequestRouting:
+    """Test coordinator request classification."""
+
+    def test_classify(self):
+        """Test that messages are routed by keyword category in priority order."""
+        assert _classify("find me a house with 3 bedrooms") == "property_search"
+        assert _classify("what are my saved preferences?") == "context"
+        assert _classify("show me the latest market trends") == "core"
+        assert _classify("hello there") == "default"
+
+    def test_parse_search_filters(self):
+        """Test extraction of price and bedroom filters from a search message."""
+        assert _parse_search_filters("find me a 3 bedroom house under $500k") == (500000.0, 3)
+        assert _parse_search_filters("search homes under 1.2m") == (1200000.0, 0)
+        assert _parse_search_filters("find me a house") == (0.0, 0)
+        assert _parse_search_filters("find a 2 br condo under 350,000") == (350000.0, 2)
+        assert _parse_search_filters("find me a house under 2 million") == (2000000.0, 0)
+        assert _parse_search_filters("find a house with at least 3 bedrooms") == (0.0, 3)
+        assert _parse_search_filters("find homes with 2 bedrooms or more") == (0.0, 2)
+        assert _parse_search_filters("find 3+ bed homes") == (0.0, 3)
+        assert _parse_search_filters("find homes with 3 or more bedrooms") == (0.0, 3)
+
+    def test_parse_search_filters_unclear(self):
+        """Test that filters the parser cannot express are reported as unclear."""
+        assert _parse_search_filters("find a house with under 4 bedrooms") is None
+        assert _parse_search_filters("find homes under 3 beds") is None
+        assert _parse_search_filters("find a house between 300k and 500k") is None
+        assert _parse_search_filters("find a house with no more than 3 bedrooms") is None
+
+    @pytest.mark.asyncio
+    async def test_property_search_skips_model(self, monkeypatch):
+        """Test that obvious property searches are answered with parsed filters before the model is called."""
+        core = StubRemoteAgent()
+        monkeypatch.setattr(domain_agent, "core_agent", core)
+
+        def request_for(text):
+            return LlmRequest(contents=[types.Content(role="user", parts=[types.Part(text=text)])])
+
+        response = await _shortcut_property_search(None, request_for("Find me a house with at least 4 bedrooms"))
+        assert "Found 1 properties" in response.content.parts[0].text
+        assert "456 Oak Ave" in response.content.parts[0].text
+        assert core.messages == ["Log property search activity: Find me a house with at least 4 bedrooms"]
+
+        response = await _shortcut_property_search(None, request_for("Find me a house under 2 million"))
+        assert "Found 2 properties" in response.content.parts[0].text
+
+        assert await _shortcut_property_search(None, request_for("Find a house with under 4 bedrooms")) is None
+        assert await _shortcut_property_search(None, request_for("What's the weather?")) is None
+
+    @pytest.mark.asyncio
+    async def test_context_route_sends_separate_messages(self, monkeypatch):
+        """Test that the session lookup and the user request reach the Context Agent as separate calls."""
+        context = StubRemoteAgent("context reply")
+        monkeypatch.setattr(domain_agent, "context_agent", context)
+        monkeypatch.setattr(domain_agent, "core_agent", StubRemoteAgent())
+
+        response = await coordinate_request("what are my saved preferences?", session_id="session_1")
+
+        assert response == "context reply"
+        assert sorted(context.messages) == [
+            "Get user context and preferences for session: session_1",
+            "Handle user request with user_id 'default_user': what are my saved preferences?",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_default_route_skips_session_update_on_failure(self, monkeypatch):
+        """Test that the session is only updated after the Core Agent answers."""
+        context = StubRemoteAgent()
+        monkeypatch.setattr(domain_agent, "context_agent", context)
+        monkeypatch.setattr(domain_agent, "core_agent", StubRemoteAgent(fail=True))
+
+        response = await coordinate_request("hello there", session_id="session_1")
+
+        assert response == "Error processing request: peer unavailable"
+        assert context.messages == ["Get user context and preferences for session: session_1"]
+
 
 def test_domain_agent_integration():
     """Test domain agent integration."""
@@ -0,0 +1,40 @@
+"""A2A utilities for connecting to remote agents."""
+
+from functools import lru_cache
+
+import httpx
+from google.adk.agents.remote_a2a_agent import AGENT_CARD_WELL_KNOWN_PATH, DEFAULT_TIMEOUT, RemoteA2aAgent
+
+# Connection pool shared by all remote agents so A2A calls reuse keep-alive connections to each peer.
+# RemoteA2aAgent only closes clients it created itself, so this one lives for the whole process.
+_http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+)
+
+
+@lru_cache(maxsize=None)
+def get_remote_agent(name: str, description: str, base_url: str) -> RemoteA2aAgent:
+    """
+    Get the shared RemoteA2aAgent for an agent served at base_url.
+
+    Instances are memoized per (name, description, base_url), so every module that talks to the
+    same peer reuses one agent and one resolved agent card. ADK fetches the card lazily on first
+    use, so calling this at import time does not block on the network. All agents share one pooled
+    HTTP client. An ADK agent can only have one parent, so a shared instance may be used as a
+    sub-agent of at most one agent.
+
+    Args:
+        name: Agent name
+        description: Agent description used for delegation
+        base_url: Base URL of the remote A2A server (e.g. http://localhost:8002)
+
+    Returns:
+        Remote A2A agent
+    """
+    return RemoteA2aAgent(
+        name=name,
+        description=description,
+        agent_card=f"{base_url}{AGENT_CARD_WELL_KNOWN_PATH}",
+        httpx_client=_http_client,
+    )